@@ -1,81 +1,64 @@
-from src.f1_data import get_race_telemetry, load_race_session, enable_cache, get_circuit_rotation
+from src.f1_data import get_race_telemetry, load_race_session, enable_cache, try_load_cached_payload
 from src.arcade_replay import run_arcade_replay
+import argparse
 import sys
 
-def main(year=None, round_number=None, playback_speed=1, session_type='R'):
-  # Enable cache for fastf1 before loading session to optimize API calls
-  enable_cache()
+def main(year=None, round_number=None, playback_speed=1, session_type='R', refresh_data=False):
+  # A cached replay carries everything the window needs, so FastF1 is only
+  # touched when there is no cache or a refresh was requested. The cache is
+  # not checked for staleness here; --refresh-data is the only invalidation.
+  race_telemetry = None
+  if not refresh_data:
+    race_telemetry = try_load_cached_payload(year, round_number, session_type)
 
-  session = load_race_session(year, round_number, session_type)
-  print(f"Loaded session: {session.event['EventName']} - {session.event['RoundNumber']}")
+  if race_telemetry is None:
+    # Enable cache for fastf1 before loading session to optimize API calls
+    enable_cache()
 
-  # Get the drivers who participated in the race
-  try:
-    race_telemetry = get_race_telemetry(session, session_type=session_type)
-  except Exception as e:
-    print(f"Error retrieving race telemetry: {e}")
-    raise
-
-  # Get example lap for track layout
-  try:
-    example_lap = session.laps.pick_fastest().get_telemetry()
-  except Exception as e:
-    print(f"Error retrieving example lap: {e}")
-    raise
+    session = load_race_session(year, round_number, session_type)
+    print(f"Loaded session: {session.event['EventName']} - {session.event['RoundNumber']}")
 
-  try:
-    drivers = session.drivers
-
-    # Get circuit rotation
-    circuit_rotation = get_circuit_rotation(session)
-  except Exception as e:
-    print(f"Error retrieving session data: {e}")
-    raise
+    # Get the drivers who participated in the race
+    try:
+      race_telemetry = get_race_telemetry(session, session_type=session_type, refresh=refresh_data)
+    except Exception as e:
+      print(f"Error retrieving race telemetry: {e}")
+      raise
 
   # Run the arcade replay
   try:
     run_arcade_replay(
     frames=race_telemetry['frames'],
     track_statuses=race_telemetry['track_statuses'],
-    example_lap=example_lap,
-    drivers=drivers,
+    example_lap=race_telemetry['example_lap'],
+    drivers=race_telemetry['drivers'],
     playback_speed=1.0,
     driver_colors=race_telemetry['driver_colors'],
-    title=f"{session.event['EventName']} - {'Sprint' if session_type == 'S' else 'Race'}",
+    title=f"{race_telemetry['event_name']} - {'Sprint' if session_type == 'S' else 'Race'}",
     total_laps=race_telemetry['total_laps'],
-    circuit_rotation=circuit_rotation,
+    circuit_rotation=race_telemetry['circuit_rotation'],
     )
   except Exception as e:
     print(f"Error running arcade replay: {e}")
     raise
 
 def parse_arguments():
-  """Parse command-line arguments with better maintainability."""
-  year = 2025
-  round_number = 12
-  session_type = 'R'
-  
-  if "--year" in sys.argv:
-    try:
-      year = int(sys.argv[sys.argv.index("--year") + 1])
-    except (ValueError, IndexError):
-      print("Invalid --year argument, using default: 2025")
-  
-  if "--round" in sys.argv:
-    try:
-      round_number = int(sys.argv[sys.argv.index("--round") + 1])
-    except (ValueError, IndexError):
-      print("Invalid --round argument, using default: 12")
-  
-  if "--sprint" in sys.argv:
-    session_type = 'S'
-  
-  return year, round_number, session_type
+  """Parse command-line arguments."""
+  parser = argparse.ArgumentParser(description="Replay an F1 race from FastF1 telemetry.")
+  parser.add_argument("--year", type=int, default=2025, help="Season year (default: 2025)")
+  parser.add_argument("--round", type=int, default=12, dest="round_number",
+                      help="Round number within the season (default: 12)")
+  parser.add_argument("--sprint", action="store_const", const="S", default="R", dest="session_type",
+                      help="Replay the sprint instead of the race")
+  parser.add_argument("--refresh-data", action="store_true",
+                      help="Recompute telemetry instead of using the cached copy")
+  return parser.parse_args()
 
 if __name__ == "__main__":
   try:
-    year, round_number, session_type = parse_arguments()
-    main(year, round_number, playback_speed=1, session_type=session_type)
+    args = parse_arguments()
+    main(args.year, args.round_number, playback_speed=1, session_type=args.session_type,
+         refresh_data=args.refresh_data)
   except Exception as e:
     print(f"Fatal error: {e}")
     sys.exit(1)
\ No newline at end of file
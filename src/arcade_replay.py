@@ -19,8 +19,9 @@ SCREEN_HEIGHT = 1200
 SCREEN_TITLE = "F1 Replay"
 
 def build_track_from_example_lap(example_lap, track_width=200):
-    plot_x_ref = example_lap["X"].to_numpy()
-    plot_y_ref = example_lap["Y"].to_numpy()
+    # example_lap may be a telemetry DataFrame or the cached {'X', 'Y'} arrays
+    plot_x_ref = np.asarray(example_lap["X"], dtype=float)
+    plot_y_ref = np.asarray(example_lap["Y"], dtype=float)
 
     # compute tangents
     dx = np.gradient(plot_x_ref)
@@ -321,7 +322,6 @@ class F1ReplayWindow(arcade.Window):
 
         # 3. Draw Cars
         try:
-            frame = self.frames[idx]
             for code, pos in frame["drivers"].items():
                 sx, sy = self.world_to_screen(pos["x"], pos["y"])
                 color = self.driver_colors.get(code, arcade.color.WHITE)
@@ -3,11 +3,18 @@ import fastf1
 import fastf1.plotting
 import numpy as np
 import json
-from datetime import timedelta
 import re
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from src.lib.tyres import get_tyre_compound_int
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib encoder is used without it
+    orjson = None
+
 def enable_cache():
     """Enable fastf1 caching with atomic directory creation."""
     cache_dir = '.fastf1-cache'
@@ -16,6 +23,7 @@ def enable_cache():
 
 FPS = 25
 DT = 1 / FPS
+EXTRACT_WORKERS = 8
 
 def load_race_session(year, round_number, session_type='R'):
     # session_type: 'R' (Race), 'S' (Sprint) etc.
@@ -24,6 +32,25 @@ def load_race_session(year, round_number, session_type='R'):
     return session
 
 
+def _per_session_cache(func):
+    """Memoize ``func(session, *args)`` on ``str(session)``, i.e. per event.
+
+    Keying on the event rather than the session object means a reloaded
+    session still hits the cache and old sessions are not kept alive.
+    """
+    cache = {}
+
+    @functools.wraps(func)
+    def wrapper(session, *args):
+        key = (str(session),) + args
+        if key not in cache:
+            cache[key] = func(session, *args)
+        return cache[key]
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+@_per_session_cache
 def get_driver_colors(session):
     color_mapping = fastf1.plotting.get_driver_color_mapping(session)
     
@@ -35,49 +62,210 @@ def get_driver_colors(session):
         rgb_colors[driver] = rgb
     return rgb_colors
 
+@_per_session_cache
 def get_circuit_rotation(session):
     circuit = session.get_circuit_info()
     return circuit.rotation
 
-def get_race_telemetry(session, session_type='R'):
-
-    # helpers ---------------------------------------------------------------
-    def _sanitize_filename(name: str, max_len: int = 200) -> str:
-        # Keep only safe characters for filenames
-        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
-        return safe[:max_len]
-
-    def _cached_filepath(event: str, suffix: str) -> str:
-        filename = f"{_sanitize_filename(event)}_{suffix}_telemetry.json"
-        return os.path.join("computed_data", filename)
-
-    def _load_cached(event: str, suffix: str):
-        path = _cached_filepath(event, suffix)
-        if not os.path.exists(path):
-            return None
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Warning: failed to read cached telemetry {path}: {e}")
+@_per_session_cache
+def get_driver_abbreviation(session, driver_no):
+    try:
+        return session.get_driver(driver_no).get("Abbreviation")
+    except Exception:
+        return str(driver_no)
+
+# Telemetry channels are float32 except lap (int16) and tyre/gear/drs (int8).
+# Float channels are linearly interpolated onto the timeline, integer ones
+# take the nearest sample so codes such as tyre and DRS are never blended.
+INTERP_CHANNELS = ('x', 'y', 'dist', 'rel_dist', 'speed')
+NEAREST_CHANNELS = ('lap', 'tyre', 'gear', 'drs')
+
+def _time_order(t):
+    """Index that sorts ``t``; a no-op ``slice`` when it is already in order.
+
+    Telemetry normally arrives in time order, so this skips the argsort and
+    turns the follow-up reindexing into views instead of copies.
+    """
+    if len(t) < 2 or (t[1:] >= t[:-1]).all():
+        return slice(None)
+    return np.argsort(t, kind='stable')
+
+def _interp_weights(timeline, t_sorted):
+    """Locate each timeline point between two samples of ``t_sorted``.
+
+    Returns the lower/upper sample indices and the blend weight, computed once
+    so every channel can be interpolated without repeating the binary search.
+    Points outside the sampled range clamp to the edge value, like ``np.interp``.
+    """
+    hi = np.searchsorted(t_sorted, timeline).clip(1, len(t_sorted) - 1)
+    lo = hi - 1
+    t0 = t_sorted[lo]
+    span = t_sorted[hi] - t0
+    w = (timeline - t0) / np.where(span == 0, 1, span)
+    return lo, hi, np.clip(w, 0.0, 1.0).astype(np.float32)
+
+# Per-driver fields exposed in each frame, with the Python type they are read as
+FRAME_FIELDS = (
+    ('x', float), ('y', float), ('dist', float), ('lap', int),
+    ('rel_dist', float), ('tyre', float), ('position', int),
+    ('speed', float), ('gear', int), ('drs', int),
+)
+
+class RaceFrames:
+    """Read-only sequence of replay frames backed by (drivers, frames) arrays.
+
+    Indexing returns the same ``{'t', 'lap', 'drivers'}`` dict the replay has
+    always consumed, but frames are only built when they are actually read.
+    """
+
+    def __init__(self, t, leader_lap, codes, channels):
+        self.t = t
+        self.leader_lap = leader_lap
+        self.codes = list(codes)
+        self.channels = channels
+        self._last_index = None
+        self._last_frame = None
+
+    def __len__(self):
+        return len(self.t)
+
+    def __getitem__(self, index):
+        # The window redraws the same frame several times at low playback speeds
+        if index == self._last_index:
+            return self._last_frame
+
+        # One column slice per channel, converted to Python scalars in bulk
+        keys = [key for key, _ in FRAME_FIELDS]
+        columns = [
+            list(map(cast, self.channels[key][:, index].tolist())) for key, cast in FRAME_FIELDS
+        ]
+        drivers = {
+            code: dict(zip(keys, values)) for code, values in zip(self.codes, zip(*columns))
+        }
+        frame = {
+            't': float(self.t[index]),
+            'lap': int(self.leader_lap[index]),
+            'drivers': drivers,
+        }
+        self._last_index = index
+        self._last_frame = frame
+        return frame
+
+    def arrays(self):
+        """Return every backing array keyed by name, e.g. for ``np.savez``."""
+        return {'t': self.t, 'leader_lap': self.leader_lap, **self.channels}
+
+    @classmethod
+    def from_arrays(cls, codes, arrays):
+        channels = {key: arrays[key] for key, _ in FRAME_FIELDS}
+        return cls(arrays['t'], arrays['leader_lap'], codes, channels)
+
+def _session_signature(session, session_type):
+    """Fingerprint of the FastF1 session data a telemetry cache is built from.
+
+    Changes whenever upstream adds or amends laps. It is only compared when
+    ``get_race_telemetry`` is called with a loaded session and ``refresh=False``,
+    i.e. by direct API callers; the CLI's cached fast path never loads a
+    session and so never checks it.
+    """
+    laps = session.laps
+    key = f"{session}|{session_type}|{len(laps)}|{laps['Time'].max()}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+# Telemetry cache ------------------------------------------------------------
+# Cache files are named from the year, round and race/sprint suffix alone, so a
+# cached replay can be found without creating or loading a FastF1 session.
+
+# Anything outside this set is replaced so names are safe as filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+def _sanitize_filename(name: str, max_len: int = 200) -> str:
+    return _UNSAFE_FILENAME_CHARS.sub("_", name)[:max_len]
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode("utf-8")
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _cache_names(year, round_number, session_type):
+    event = f"{year}_{round_number}"
+    suffix = 'sprint' if session_type == 'S' else 'race'
+    return event, suffix
+
+def _cached_filepath(event: str, suffix: str, ext: str) -> str:
+    filename = f"{_sanitize_filename(event)}_{suffix}_telemetry.{ext}"
+    return os.path.join("computed_data", filename)
+
+def _load_cached(event: str, suffix: str, signature=None):
+    # The JSON sidecar is written last, so its presence marks a complete cache
+    meta_path = _cached_filepath(event, suffix, "json")
+    arrays_path = _cached_filepath(event, suffix, "npz")
+    if not os.path.exists(meta_path) or not os.path.exists(arrays_path):
+        return None
+    try:
+        with open(meta_path, "rb") as f:
+            payload = _json_loads(f.read())
+        # Only the small sidecar is read when the cache is stale
+        cached_signature = payload.pop('_sig', None)
+        if signature is not None and cached_signature != signature:
+            print(f"Cached {suffix} telemetry is out of date, recomputing.")
             return None
-
-    def _save_cached(event: str, suffix: str, payload: dict):
-        os.makedirs("computed_data", exist_ok=True)
-        path = _cached_filepath(event, suffix)
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2)
-        except Exception as e:
-            print(f"Warning: failed to write cached telemetry {path}: {e}")
-
-    # main flow ------------------------------------------------------------
-    event_name = _sanitize_filename(str(session))
-    cache_suffix = 'sprint' if session_type == 'S' else 'race'
+        with np.load(arrays_path) as data:
+            arrays = {key: data[key] for key in data.files}
+        payload['frames'] = RaceFrames.from_arrays(payload.pop('codes'), arrays)
+        payload['example_lap'] = {'X': arrays['example_lap_x'], 'Y': arrays['example_lap_y']}
+        return payload
+    except Exception as e:
+        print(f"Warning: failed to read cached telemetry {meta_path}: {e}")
+        return None
+
+def _save_cached(event: str, suffix: str, payload: dict, signature: str):
+    os.makedirs("computed_data", exist_ok=True)
+    meta_path = _cached_filepath(event, suffix, "json")
+    arrays_path = _cached_filepath(event, suffix, "npz")
+    frames = payload['frames']
+    example_lap = payload['example_lap']
+    meta = {key: value for key, value in payload.items() if key not in ('frames', 'example_lap')}
+    meta['codes'] = frames.codes
+    meta['_sig'] = signature
+    try:
+        np.savez_compressed(
+            arrays_path,
+            example_lap_x=example_lap['X'],
+            example_lap_y=example_lap['Y'],
+            **frames.arrays(),
+        )
+        with open(meta_path, "wb") as f:
+            f.write(_json_dumps(meta))
+    except Exception as e:
+        print(f"Warning: failed to write cached telemetry {meta_path}: {e}")
+
+def try_load_cached_payload(year, round_number, session_type='R'):
+    """Return the cached replay payload for an event, or None if there is none.
+
+    No FastF1 session is created, so the cache is NOT validated against the
+    upstream data: a stale cache is returned as-is. On this path (the CLI's
+    default) ``--refresh-data`` is the only way to invalidate a cache.
+    """
+    event, suffix = _cache_names(year, round_number, session_type)
+    cached = _load_cached(event, suffix)
+    if cached:
+        print(f"Loaded precomputed {suffix} telemetry data.")
+        print("The replay should begin in a new window shortly!")
+    return cached
+
+def get_race_telemetry(session, session_type='R', refresh=False):
+    event_name, cache_suffix = _cache_names(session.event.year, session.event['RoundNumber'], session_type)
+    signature = _session_signature(session, session_type)
 
     # Attempt to load precomputed data unless explicitly requested to refresh
-    if "--refresh-data" not in os.sys.argv:
-        cached = _load_cached(event_name, cache_suffix)
+    if not refresh:
+        cached = _load_cached(event_name, cache_suffix, signature)
         if cached:
             print(f"Loaded precomputed {cache_suffix} telemetry data.")
             print("The replay should begin in a new window shortly!")
@@ -86,118 +274,165 @@ def get_race_telemetry(session, session_type='R'):
     drivers = session.drivers
 
     # Build mapping driver_no -> abbreviation defensively
-    driver_codes = {}
-    for num in drivers:
-        try:
-            driver_codes[num] = session.get_driver(num).get("Abbreviation")
-        except Exception:
-            driver_codes[num] = str(num)
-
-    driver_data = {}
-    global_t_min = None
-    global_t_max = None
-    max_lap_number = 0
+    driver_codes = {num: get_driver_abbreviation(session, num) for num in drivers}
 
     # 1. Extract per-driver telemetry and concatenate per-lap arrays
-    for driver_no in drivers:
+    def _extract(driver_no):
+        """Return ``(code, data, lap_count, log)``; ``data`` is None if the driver is skipped.
+
+        Runs on a worker thread, so messages are buffered in ``log`` and
+        printed by the caller instead of interleaving on stdout.
+        """
         code = driver_codes.get(driver_no, str(driver_no))
-        print("Getting telemetry for driver:", code)
+        log = [f"Getting telemetry for driver: {code}"]
 
         try:
             laps_driver = session.laps.pick_drivers(driver_no)
         except Exception as e:
-            print(f"Warning: failed to get laps for {code}: {e}")
-            continue
+            log.append(f"Warning: failed to get laps for {code}: {e}")
+            return code, None, 0, log
 
         if laps_driver.empty:
-            continue
+            return code, None, 0, log
 
-        max_lap_number = max(max_lap_number, int(laps_driver.LapNumber.max()))
+        lap_count = int(laps_driver.LapNumber.max())
 
         parts = {
             't': [], 'x': [], 'y': [], 'dist': [], 'rel_dist': [],
-            'lap': [], 'tyre': [], 'speed': [], 'gear': [], 'drs': []
+            'speed': [], 'gear': [], 'drs': []
         }
+        # Lap number and tyre are constant over a lap, so only one value per
+        # lap is kept and expanded to per-sample arrays when concatenating
+        lap_numbers = []
+        tyre_ints = []
+        lap_sizes = []
+
+        # Fetch the driver's whole session once and cut laps out of it by
+        # time, instead of having FastF1 slice and merge telemetry per lap
+        try:
+            car_data = session.car_data[driver_no].add_distance()
+            tel = session.pos_data[driver_no].merge_channels(car_data)
+        except Exception as e:
+            log.append(f"Warning: failed to get telemetry for {code}: {e}")
+            return code, None, lap_count, log
+
+        if tel.empty:
+            return code, None, lap_count, log
+
+        t_tel = tel["SessionTime"].dt.total_seconds().to_numpy()
+        x_tel = tel["X"].to_numpy(dtype=np.float32)
+        y_tel = tel["Y"].to_numpy(dtype=np.float32)
+        d_tel = tel["Distance"].to_numpy()
+        speed_tel = tel.get("Speed", tel.get("SpeedKph", None)).to_numpy(dtype=np.float32)
+        if "nGear" in tel:
+            gear_tel = tel["nGear"].to_numpy(dtype=np.int8)
+        else:
+            gear_tel = np.zeros(len(t_tel), dtype=np.int8)
+        if "DRS" in tel:
+            drs_tel = tel["DRS"].to_numpy(dtype=np.int8)
+        else:
+            drs_tel = np.zeros(len(t_tel), dtype=np.int8)
+
+        # Sample index range [start, end) of every lap within the session telemetry
+        laps_timed = laps_driver.dropna(subset=['LapStartTime', 'Time'])
+        lap_starts = np.searchsorted(t_tel, laps_timed['LapStartTime'].dt.total_seconds().to_numpy())
+        lap_ends = np.searchsorted(t_tel, laps_timed['Time'].dt.total_seconds().to_numpy(), side='right')
 
         total_dist_so_far = 0.0
-        for _, lap in laps_driver.iterlaps():
-            try:
-                lap_tel = lap.get_telemetry()
-            except Exception:
+        for lap_number, compound, start, end in zip(
+            laps_timed['LapNumber'], laps_timed['Compound'], lap_starts, lap_ends
+        ):
+            if end <= start:
                 continue
 
-            lap_number = int(lap.LapNumber)
-            tyre_compound_int = get_tyre_compound_int(getattr(lap, 'Compound', ''))
+            lap_number = int(lap_number)
+            tyre_compound_int = get_tyre_compound_int(compound if isinstance(compound, str) else '')
 
-            if lap_tel.empty:
-                continue
-
-            t_lap = lap_tel["SessionTime"].dt.total_seconds().to_numpy()
-            x_lap = lap_tel["X"].to_numpy()
-            y_lap = lap_tel["Y"].to_numpy()
-            d_lap = lap_tel["Distance"].to_numpy()
-            rd_lap = lap_tel.get("RelativeDistance", lap_tel["Distance"]).to_numpy()
-            speed_kph_lap = lap_tel.get("Speed", lap_tel.get("SpeedKph", None)).to_numpy()
-            gear_lap = lap_tel.get("nGear", np.zeros_like(t_lap)).to_numpy()
-            drs_lap = lap_tel.get("DRS", np.zeros_like(t_lap)).to_numpy()
+            lap = slice(start, end)
+            t_lap = t_tel[lap]
+            # Distance restarts at each lap's first sample, as in Lap.get_telemetry()
+            d_lap = d_tel[lap] - d_tel[start]
+            lap_length = d_lap[-1]
+            if lap_length > 0:
+                rd_lap = (d_lap / lap_length).astype(np.float32)
+            else:
+                rd_lap = np.zeros(len(t_lap), dtype=np.float32)
 
             race_d_lap = total_dist_so_far + d_lap
 
             parts['t'].append(t_lap)
-            parts['x'].append(x_lap)
-            parts['y'].append(y_lap)
-            parts['dist'].append(race_d_lap)
+            parts['x'].append(x_tel[lap])
+            parts['y'].append(y_tel[lap])
+            parts['dist'].append(race_d_lap.astype(np.float32))
             parts['rel_dist'].append(rd_lap)
-            parts['lap'].append(np.full_like(t_lap, lap_number))
-            parts['tyre'].append(np.full_like(t_lap, tyre_compound_int))
-            parts['speed'].append(speed_kph_lap)
-            parts['gear'].append(gear_lap)
-            parts['drs'].append(drs_lap)
+            parts['speed'].append(speed_tel[lap])
+            parts['gear'].append(gear_tel[lap])
+            parts['drs'].append(drs_tel[lap])
+            lap_numbers.append(lap_number)
+            tyre_ints.append(tyre_compound_int)
+            lap_sizes.append(len(t_lap))
 
             # Update cumulative distance for next lap
-            total_dist_so_far = float(race_d_lap[-1]) if len(race_d_lap) else total_dist_so_far
+            total_dist_so_far = float(race_d_lap[-1])
 
         if not parts['t']:
-            continue
+            return code, None, lap_count, log
 
-        # Concatenate arrays and sort by time
+        # Concatenate into (channels, samples) blocks so that reordering by
+        # time is one gather per block rather than one per channel. Laps are
+        # cut from time-ordered telemetry, so usually no sort is needed.
         try:
             t_all = np.concatenate(parts['t'])
-            order = np.argsort(t_all)
-
-            def _concat_and_sort(key):
-                arr = np.concatenate(parts[key])
-                return arr[order]
+            floats = np.stack([np.concatenate(parts[key]) for key in INTERP_CHANNELS])
+            int_columns = {
+                'lap': np.repeat(np.asarray(lap_numbers, dtype=np.int16), lap_sizes),
+                'tyre': np.repeat(np.asarray(tyre_ints, dtype=np.int8), lap_sizes),
+                'gear': np.concatenate(parts['gear']),
+                'drs': np.concatenate(parts['drs']),
+            }
+            ints = np.stack([int_columns[key] for key in NEAREST_CHANNELS])
 
+            order = _time_order(t_all)
             t_all = t_all[order]
-            x_all = _concat_and_sort('x')
-            y_all = _concat_and_sort('y')
-            dist_all = _concat_and_sort('dist')
-            rel_dist_all = _concat_and_sort('rel_dist')
-            lap_all = _concat_and_sort('lap')
-            tyre_all = _concat_and_sort('tyre')
-            speed_all = _concat_and_sort('speed')
-            gear_all = _concat_and_sort('gear')
-            drs_all = _concat_and_sort('drs')
+            floats = floats[:, order]
+            ints = ints[:, order]
         except Exception as e:
-            print(f"Warning: failed to concatenate telemetry for {code}: {e}")
-            continue
+            log.append(f"Warning: failed to concatenate telemetry for {code}: {e}")
+            return code, None, lap_count, log
 
-        driver_data[code] = {
-            't': t_all,
-            'x': x_all,
-            'y': y_all,
-            'dist': dist_all,
-            'rel_dist': rel_dist_all,
-            'lap': lap_all,
-            'tyre': tyre_all,
-            'speed': speed_all,
-            'gear': gear_all,
-            'drs': drs_all,
-        }
+        data = {'t': t_all, **dict(zip(INTERP_CHANNELS, floats))}
+        for key, row in zip(NEAREST_CHANNELS, ints):
+            # the stacked block shares one integer dtype; restore each channel's own
+            data[key] = row.astype(int_columns[key].dtype)
+
+        return code, data, lap_count, log
 
-        t_min = float(t_all.min())
-        t_max = float(t_all.max())
+    # Drivers are independent and FastF1/pandas/numpy release the GIL in
+    # their I/O and array work, so extracting them concurrently overlaps it
+    extracted = {}
+    max_lap_number = 0
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+        futures = [pool.submit(_extract, driver_no) for driver_no in drivers]
+        for future in as_completed(futures):
+            code, data, lap_count, log = future.result()
+            print("\n".join(log))
+            max_lap_number = max(max_lap_number, lap_count)
+            if data is not None:
+                extracted[code] = data
+
+    # Reduce in the original driver order so the output does not depend on timing
+    driver_data = {}
+    global_t_min = None
+    global_t_max = None
+    for driver_no in drivers:
+        code = driver_codes.get(driver_no, str(driver_no))
+        if code not in extracted:
+            continue
+        data = extracted.pop(code)
+        driver_data[code] = data
+
+        t_min = float(data['t'].min())
+        t_max = float(data['t'].max())
         global_t_min = t_min if global_t_min is None else min(global_t_min, t_min)
         global_t_max = t_max if global_t_max is None else max(global_t_max, t_max)
 
@@ -207,112 +442,99 @@ def get_race_telemetry(session, session_type='R'):
     # 2. Create a timeline (start from zero)
     timeline = np.arange(global_t_min, global_t_max + DT, DT) - global_t_min
 
-    # 3. Resample each driver's telemetry onto the common timeline
-    resampled_data = {}
-    for code, data in driver_data.items():
+    # 3. Resample each driver's telemetry straight into (drivers, frames)
+    # channel matrices, releasing the driver's raw samples once it is done so
+    # peak memory stays near one copy of the data rather than three
+    codes = []
+    channels = {}
+    n_drivers = len(driver_data)
+    for code in list(driver_data):
+        data = driver_data.pop(code)
         try:
             t = data['t'] - global_t_min
-            order = np.argsort(t)
+            order = _time_order(t)
             t_sorted = t[order]
-            # helper to safe interp (requires sorted arrays)
-            def _safe_interp(arr):
-                return np.interp(timeline, t_sorted, arr[order])
-
-            resampled_data[code] = {
-                't': timeline,
-                'x': _safe_interp(data['x']),
-                'y': _safe_interp(data['y']),
-                'dist': _safe_interp(data['dist']),
-                'rel_dist': _safe_interp(data['rel_dist']),
-                'lap': _safe_interp(data['lap']),
-                'tyre': _safe_interp(data['tyre']),
-                'speed': _safe_interp(data['speed']),
-                'gear': _safe_interp(data['gear']),
-                'drs': _safe_interp(data['drs']),
-            }
+            lo, hi, w = _interp_weights(timeline, t_sorted)
+
+            # Blend every float channel in one pass over a stacked (channels, samples) block
+            stack = np.empty((len(INTERP_CHANNELS), len(t_sorted)), dtype=np.float32)
+            for row, key in enumerate(INTERP_CHANNELS):
+                stack[row] = data[key][order]
+            resampled = dict(zip(INTERP_CHANNELS, stack[:, lo] * (1 - w) + stack[:, hi] * w))
+
+            # Integer channels take the nearest sample rather than a blend
+            nearest = np.where(w < 0.5, lo, hi)
+            for key in NEAREST_CHANNELS:
+                resampled[key] = data[key][order][nearest]
         except Exception as e:
             print(f"Warning: failed to resample telemetry for {code}: {e}")
+            continue
+
+        row = len(codes)
+        for key, values in resampled.items():
+            if key not in channels:
+                channels[key] = np.empty((n_drivers, len(timeline)), dtype=values.dtype)
+            channels[key][row] = values
+        codes.append(code)
+
+    # Drop rows left unused by drivers that failed to resample (views, no copy)
+    channels = {key: matrix[:len(codes)] for key, matrix in channels.items()}
 
     # 4. Incorporate track status data into the timeline
     formatted_track_statuses = []
     try:
         track_status = getattr(session, 'track_status', None)
-        if track_status is not None:
-            for status in track_status.to_dict('records'):
-                seconds = timedelta.total_seconds(status['Time'])
-                start_time = seconds - global_t_min
-                end_time = None
-                if formatted_track_statuses:
-                    formatted_track_statuses[-1]['end_time'] = start_time
-                formatted_track_statuses.append({
-                    'status': status.get('Status'),
-                    'start_time': start_time,
-                    'end_time': end_time,
-                })
+        if track_status is not None and not track_status.empty:
+            # Each status lasts until the next one starts; the last is open-ended
+            starts = (track_status['Time'].dt.total_seconds() - global_t_min).tolist()
+            ends = starts[1:] + [None]
+            statuses = track_status['Status'].tolist()
+            formatted_track_statuses = [
+                {'status': status, 'start_time': start_time, 'end_time': end_time}
+                for status, start_time, end_time in zip(statuses, starts, ends)
+            ]
     except Exception as e:
         print(f"Warning: failed to process track status: {e}")
 
     # 5. Build frames
-    frames = []
-    for i, t in enumerate(timeline):
-        frame_drivers = {}
-        for code, d in resampled_data.items():
-            try:
-                frame_drivers[code] = {
-                    'x': float(d['x'][i]),
-                    'y': float(d['y'][i]),
-                    'dist': float(d['dist'][i]),
-                    'lap': int(round(d['lap'][i])),
-                    'rel_dist': float(d['rel_dist'][i]),
-                    'tyre': d['tyre'][i],
-                    'speed': d['speed'][i],
-                    'gear': int(round(d['gear'][i])),
-                    'drs': int(round(d['drs'][i])),
-                }
-            except Exception:
-                continue
-
-        if not frame_drivers:
-            continue
-
-        # sort to find leader
-        snapshot = sorted([
-            {'code': c, 'dist': v['dist'], 'lap': v['lap'], 'x': v['x'], 'y': v['y'], 'rel_dist': v['rel_dist'], 'tyre': v['tyre'], 'speed': v['speed'], 'gear': v['gear'], 'drs': v['drs']}
-            for c, v in frame_drivers.items()
-        ], key=lambda r: r['dist'], reverse=True)
-
-        leader = snapshot[0]
-        leader_lap = leader['lap']
-
-        frame_data = {}
-        for idx, car in enumerate(snapshot):
-            frame_data[car['code']] = {
-                'x': car['x'],
-                'y': car['y'],
-                'dist': car['dist'],
-                'lap': car['lap'],
-                'rel_dist': round(car['rel_dist'], 4),
-                'tyre': car['tyre'],
-                'position': idx + 1,
-                'speed': car['speed'],
-                'gear': car['gear'],
-                'drs': car['drs'],
-            }
-
-        frames.append({'t': float(t), 'lap': leader_lap, 'drivers': frame_data})
+    # Positions and the leader's lap are computed for all frames in single
+    # vectorized passes over the (drivers, frames) matrices instead of
+    # sorting a list of dicts per timeline tick.
+    dist_arr = channels['dist']
+    lap_arr = channels['lap']
+    np.round(channels['rel_dist'], 4, out=channels['rel_dist'])
+
+    # order[k, i] is the driver in place k + 1 at frame i; scattering the
+    # places back through it gives each driver's position without a second sort
+    order = np.argsort(-dist_arr, axis=0)
+    positions = np.empty(dist_arr.shape, dtype=np.uint8)
+    places = np.arange(1, len(codes) + 1, dtype=np.uint8)[:, None]
+    np.put_along_axis(positions, order, places, axis=0)
+    channels['position'] = positions
+    leader_lap = lap_arr[order[0], np.arange(len(timeline))]
+
+    frames = RaceFrames(timeline, leader_lap, codes, channels)
 
     print("completed telemetry extraction...")
-    print("Saving to JSON file...")
+    print("Saving telemetry cache...")
+
+    # Track layout and event details are stored too, so that a cached replay
+    # never needs to load the session again
+    example_lap = session.laps.pick_fastest().get_telemetry()
 
     payload = {
         'frames': frames,
         'driver_colors': get_driver_colors(session),
         'track_statuses': formatted_track_statuses,
         'total_laps': int(max_lap_number),
+        'example_lap': {'X': example_lap['X'].to_numpy(), 'Y': example_lap['Y'].to_numpy()},
+        'circuit_rotation': float(get_circuit_rotation(session)),
+        'event_name': session.event['EventName'],
+        'drivers': list(drivers),
     }
 
     try:
-        _save_cached(event_name, cache_suffix, payload)
+        _save_cached(event_name, cache_suffix, payload, signature)
         print("Saved Successfully!")
     except Exception:
         print("Warning: failed to persist telemetry cache")
@@ -1,4 +1,4 @@
-
+import functools
 
 tyre_compounds_ints = {
   "SOFT": 0,
@@ -8,6 +8,8 @@ tyre_compounds_ints = {
   "WET": 4,
 }
 
+# Called for every lap of every driver with only a handful of distinct values
+@functools.lru_cache(maxsize=16)
 def get_tyre_compound_int(compound_str):
   return int(tyre_compounds_ints.get(compound_str.upper(), -1))
 